@@ -23,9 +23,16 @@ from .version import __version__
 from .dqstutil import \
     _is_valid_colnames, is_numeric, is_possible_date, \
     is_possible_numeric, determine_column_type, \
-    inspect_dataset, gen_unique_values_count, \
+    COLUMN_TYPE_CODES, classify_column, \
+    set_type_matrix_cache, clear_type_matrix_cache, \
+    set_column_type_cache, column_type_cache_info, \
+    clear_column_type_cache, \
+    inspect_dataset, inspect_csv, DatasetProfile, \
+    gen_unique_values_count, \
     extract_unique_values, _extract_unique_values, \
-    gen_freq_table, load_csv_dataset, add_column, \
+    gen_freq_table, crosstab, gen_histogram, GroupBy, group_by, \
+    FrequencySketch, load_csv_dataset, clear_csv_cache, iter_csv_dataset, \
+    MappedCSVDataset, ColumnarDataset, load_csv_columns, add_column, \
     remove_column, modify_column, transform_column, \
     remove_columns, extract_row_range, extract_rows
 
@@ -35,12 +42,31 @@ __all__ = [
     'is_possible_date',
     'is_possible_numeric',
     'determine_column_type',
+    'COLUMN_TYPE_CODES',
+    'classify_column',
+    'set_type_matrix_cache',
+    'clear_type_matrix_cache',
+    'set_column_type_cache',
+    'column_type_cache_info',
+    'clear_column_type_cache',
     'inspect_dataset',
+    'inspect_csv',
+    'DatasetProfile',
     'gen_unique_values_count',
     'extract_unique_values',
     '_extract_unique_values',
     'gen_freq_table',
+    'crosstab',
+    'gen_histogram',
+    'GroupBy',
+    'group_by',
+    'FrequencySketch',
     'load_csv_dataset',
+    'clear_csv_cache',
+    'iter_csv_dataset',
+    'MappedCSVDataset',
+    'ColumnarDataset',
+    'load_csv_columns',
     'add_column',
     'remove_column',
     'modify_column',
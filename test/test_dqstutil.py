@@ -8,11 +8,29 @@ The following functions are tested:
 *  is_possible_date
 *  is_possible_numeric
 *  determine_column_type
+*  classify_column
+*  set_column_type_cache
+*  column_type_cache_info
+*  clear_column_type_cache
+*  set_type_matrix_cache
+*  clear_type_matrix_cache
 *  inspect_dataset
+*  inspect_csv
+*  DatasetProfile
 *  extract_unique_values
 *  _extract_unique_values
 *  gen_freq_table
+*  crosstab
+*  gen_histogram
+*  group_by
+*  GroupBy
+*  FrequencySketch
 *  load_csv_dataset
+*  clear_csv_cache
+*  iter_csv_dataset
+*  MappedCSVDataset
+*  load_csv_columns
+*  ColumnarDataset
 *  add_column
 *  remove_column
 *  modify_column
@@ -25,9 +43,23 @@ The following functions are tested:
 
 import unittest
 
+# Seeded random test values (classifier fuzz tests)
+from random import Random
+
 # Temporary file creation/deletion ('load_csv_dataset')
-from os import unlink
-from tempfile import NamedTemporaryFile
+from os import listdir, unlink
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+
+# Compressed file creation ('load_csv_dataset')
+from bz2 import compress as bz2_compress
+from gzip import compress as gzip_compress
+from lzma import compress as xz_compress
+
+# Pickled state round trips ('GroupBy')
+import pickle
+
+# Typed column checks ('load_csv_columns')
+from array import array
 
 # Test captured stdout ('inspect_dataset')
 from io import StringIO
@@ -218,6 +250,201 @@ class Tests_determine_column_type_Function(unittest.TestCase):
         self.assertEqual(test_result, 'PD')
 
 
+class Tests_classify_column_Function(unittest.TestCase):
+    """
+    Unit tests for the function, `classify_column`.
+    """
+
+    def tearDown(self):
+        set_column_type_cache()
+
+    def test_empty_column(self):
+        test_result = classify_column([])
+        self.assertEqual(list(test_result), [])
+
+    def test_classify_column_ok(self):
+        values = ['sgsgsg', '15M', '-4.1', 'January 1, 1999', '15M']
+        exp_types = ['T', 'PN', 'N', 'PD', 'PN']
+        test_result = \
+            [COLUMN_TYPE_CODES[code] for code in classify_column(values)]
+        self.assertEqual(test_result, exp_types)
+
+    def test_classify_column_cache_hits(self):
+        set_column_type_cache(16)
+        classify_column(['x'] * 10)
+        info = column_type_cache_info()
+        self.assertTrue(info.hits == 9 and info.misses == 1)
+
+    def test_classify_column_cache_disabled(self):
+        set_column_type_cache(0)
+        values = ['x', 'y', '1', 'x']
+        test_result = \
+            [COLUMN_TYPE_CODES[code] for code in classify_column(values)]
+        self.assertEqual(test_result, ['T', 'T', 'N', 'T'])
+
+    def test_classify_column_matches_determine_column_type(self):
+        values = ['a1', 'jul', '4.2.4', '1-10-2021', '7', '$3', '']
+        test_result = \
+            [COLUMN_TYPE_CODES[code] for code in classify_column(values)]
+        self.assertEqual(test_result,
+                         [determine_column_type(x) for x in values])
+
+
+class Tests_column_type_classifier_Fuzz(unittest.TestCase):
+    """
+    Fuzz tests comparing `is_numeric`, `is_possible_date`,
+    `is_possible_numeric`, and `determine_column_type` with reference,
+    exception and character-scanning based, implementations.
+    """
+
+    atoms = \
+        list('0123456789') + list('.$/-+eEjJ() \t\x0b\x1c_,xM') \
+        + ['inf', 'Infinity', 'nan', 'jan', 'SEP', '\u0663', '\u00b2',
+           '\u00bd', '\u017f', '\u0130', '\u3000']
+
+    @staticmethod
+    def ref_is_numeric(numstr):
+        if not isinstance(numstr, str):
+            return type(numstr) in [int, float, complex]
+        try:
+            complex(numstr)
+            return True
+        except ValueError:
+            return numstr.isnumeric()
+
+    @staticmethod
+    def ref_is_possible_date(datestr):
+        months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
+                  'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+        datestr = datestr.lower()
+        return \
+            any(month in datestr for month in months) \
+            or len([c for c in datestr if c in '/-']) == 2
+
+    def ref_is_possible_numeric(self, numstr):
+        return \
+            any(c.isdigit() for c in numstr) \
+            and not self.ref_is_possible_date(numstr) \
+            and len([c for c in numstr if c == '.']) < 2 \
+            and len([c for c in numstr if c == '$']) < 2
+
+    def ref_determine_column_type(self, coldata):
+        if self.ref_is_numeric(coldata):
+            return 'N'
+        if self.ref_is_possible_numeric(coldata):
+            return 'PN'
+        if self.ref_is_possible_date(coldata):
+            return 'PD'
+        return 'T'
+
+    def test_classifier_matches_reference(self):
+        rng = Random(20211018)
+        mismatches = []
+        for _ in range(20000):
+            value = ''.join(rng.choice(self.atoms)
+                            for _ in range(rng.randint(0, 8)))
+            if is_numeric(value) != self.ref_is_numeric(value) \
+               or is_possible_date(value) \
+               != self.ref_is_possible_date(value) \
+               or is_possible_numeric(value) \
+               != self.ref_is_possible_numeric(value) \
+               or determine_column_type(value) \
+               != self.ref_determine_column_type(value):
+                mismatches.append(value)
+        self.assertEqual(mismatches, [])
+
+
+class Tests_column_type_cache_Functions(unittest.TestCase):
+    """
+    Unit tests for the functions, `set_column_type_cache`,
+    `column_type_cache_info`, and `clear_column_type_cache`.
+    """
+
+    def tearDown(self):
+        set_column_type_cache()
+
+    def test_cache_hits_and_misses(self):
+        header = ['a', 'b']
+        dataset = [['x', '1'], ['x', '1'], ['x', '2']]
+        set_column_type_cache(16)
+        inspect_dataset(dataset, header, generate_report=False)
+        info = column_type_cache_info()
+        test_result = \
+            info.hits == 3 \
+            and info.misses == 3 \
+            and info.maxsize == 16 \
+            and info.currsize == 3
+        self.assertTrue(test_result)
+
+    def test_cache_clear(self):
+        set_column_type_cache(16)
+        gen_unique_values_count([['x'], ['y']], ['a'], 'a')
+        clear_column_type_cache()
+        info = column_type_cache_info()
+        self.assertTrue(info.hits == 0 and info.currsize == 0)
+
+    def test_cache_disabled(self):
+        header = ['a', 'b']
+        dataset = [['x', '1'], ['x', '1'], ['x', '2']]
+        exp_result = inspect_dataset(dataset, header,
+                                     generate_report=False)
+        set_column_type_cache(0)
+        test_result = inspect_dataset(dataset, header,
+                                      generate_report=False)
+        test_result = \
+            column_type_cache_info() is None \
+            and test_result == exp_result
+        self.assertTrue(test_result)
+
+
+class Tests_type_matrix_cache_Functions(unittest.TestCase):
+    """
+    Unit tests for the functions, `set_type_matrix_cache`, and
+    `clear_type_matrix_cache`.
+    """
+
+    def setUp(self):
+        set_type_matrix_cache(True)
+        set_column_type_cache(16)
+
+    def tearDown(self):
+        set_type_matrix_cache(False)
+        set_column_type_cache()
+
+    def test_codes_reused(self):
+        header = ['a', 'b']
+        dataset = [['x', '1'], ['y', '2'], ['z', '3']]
+        exp_result = inspect_dataset(dataset, header,
+                                     generate_report=False)
+        clear_column_type_cache()
+        gen_unique_values_count(dataset, header, 'a')
+        extract_unique_values(dataset, header, 'b', coltype='N')
+        test_result = \
+            inspect_dataset(dataset, header, generate_report=False) \
+            == exp_result \
+            and column_type_cache_info().misses == 0
+        self.assertTrue(test_result)
+
+    def test_codes_invalidated_by_modification(self):
+        header = ['a', 'b']
+        dataset = [['x', '1'], ['y', '2'], ['z', '3']]
+        self.assertEqual(gen_unique_values_count(dataset, header, 'b'),
+                         {'N': 3})
+        transform_column(dataset, header, 'b', lambda x: x + 'q',
+                         inplace=True)
+        self.assertEqual(gen_unique_values_count(dataset, header, 'b'),
+                         {'PN': 3})
+
+    def test_codes_with_non_conformant_rows(self):
+        header = ['a', 'b']
+        dataset = [['x', '1'], ['y'], ['z', '3', '4']]
+        exp_result = ([1, 2], {'a': {'T': 1}, 'b': {'N': 1}},
+                      {'a': {'T': 1}, 'b': {'N': 1}})
+        test_result = inspect_dataset(dataset, header,
+                                      generate_report=False)
+        self.assertEqual(test_result, exp_result)
+
+
 class Tests_inspect_dataset_Function(unittest.TestCase):
     """
     Unit tests for the function, `inspect_dataset`.
@@ -244,6 +471,61 @@ class Tests_inspect_dataset_Function(unittest.TestCase):
             and uniques == exp_uniques
         self.assertTrue(test_result)
 
+    def test_return_tuple_empty_dataset(self):
+        header = ['a', 'b', 'c']
+        dataset = []
+        exp_columns = {'a': {}, 'b': {}, 'c': {}}
+        exp_uniques = {'a': {}, 'b': {}, 'c': {}}
+        skiprows, columns, uniques = \
+            inspect_dataset(dataset, header, generate_report=False)
+        test_result = \
+            skiprows == [] \
+            and columns == exp_columns \
+            and uniques == exp_uniques
+        self.assertTrue(test_result)
+
+    def test_return_tuple_workers(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a1', 'b1', 'c1'],
+            ['a2', 'c2'],
+            ['a3', 'b3', 'c3'],
+            ['a4', 'bib', '3'],
+            ['ay', 'bib', 'x'],
+            ['ay', 'bib', 'x'],
+            ['1-2-3'],
+            ['jan', '$4', '5.5']
+        ]
+        exp_result = inspect_dataset(dataset, header,
+                                     generate_report=False)
+        test_result = inspect_dataset(dataset, header,
+                                      generate_report=False, workers=2)
+        self.assertEqual(test_result, exp_result)
+
+    def test_return_tuple_approx(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a1', 'b1', 'c1'],
+            ['a2', 'c2'],
+            ['a3', 'b3', 'c3'],
+            ['a4', 'bib', '3'],
+            ['ay', 'bib', 'x'],
+            ['ay', 'bib', 'x']
+        ]
+        exp_result = inspect_dataset(dataset, header,
+                                     generate_report=False)
+        test_result = inspect_dataset(dataset, header,
+                                      generate_report=False, approx=True)
+        self.assertEqual(test_result, exp_result)
+
+    def test_approx_precision_out_of_range(self):
+        header = ['a', 'b', 'c']
+        dataset = [['a1', 'b1', 'c1']]
+        test_result = inspect_dataset(dataset, header,
+                                      generate_report=False, approx=True,
+                                      precision=3)
+        self.assertIsNone(test_result)
+
     def test_report_output(self):
         header = ['a', 'b', 'c']
         dataset = [
@@ -267,6 +549,94 @@ class Tests_inspect_dataset_Function(unittest.TestCase):
         self.assertEqual(output, exp_output)
 
 
+class Tests_inspect_csv_Function(unittest.TestCase):
+    """
+    Unit tests for the function, `inspect_csv`.
+    """
+
+    def test_non_existent_file(self):
+        filename = '***NON_EXISTENT_FILE***'
+        test_result = inspect_csv(filename, generate_report=False)
+        self.assertIsNone(test_result)
+
+    def test_return_tuple(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a1', 'b1', 'c1'],
+            ['a2', 'c2'],
+            ['a3', 'b3', 'c3'],
+            ['a4', 'bib', '3'],
+            ['ay', 'bib', 'x'],
+            ['ay', 'bib', 'x']
+        ]
+        csvdata = 'a,b,c\na1,b1,c1\na2,c2\na3,b3,c3\n' \
+            + 'a4,bib,3\nay,bib,x\nay,bib,x\n'
+        file = NamedTemporaryFile(mode='w+', delete=False)
+        filename = file.name
+        _ = file.write(csvdata)
+        file.close()
+        test_result = inspect_csv(filename, generate_report=False)
+        unlink(filename)
+        exp_result = inspect_dataset(dataset, header,
+                                     generate_report=False)
+        self.assertEqual(test_result, exp_result)
+
+
+class Tests_DatasetProfile_Class(unittest.TestCase):
+    """
+    Unit tests for the class, `DatasetProfile`.
+    """
+
+    header = ['a', 'b', 'c']
+    dataset = [
+        ['a1', 'b1', 'c1'],
+        ['a2', 'c2'],
+        ['a3', 'b3', 'c3'],
+        ['a4', 'bib', '3'],
+        ['ay', 'bib', 'x'],
+        ['ay'],
+        ['ay', 'bib', 'x']
+    ]
+
+    def test_metadata_ok(self):
+        profile = DatasetProfile(self.header, self.dataset)
+        exp_result = inspect_dataset(self.dataset, self.header,
+                                     generate_report=False)
+        self.assertEqual(profile.metadata(), exp_result)
+
+    def test_update_ok(self):
+        profile = DatasetProfile(self.header, self.dataset[:3])
+        profile.update(self.dataset[3:])
+        exp_result = inspect_dataset(self.dataset, self.header,
+                                     generate_report=False)
+        test_result = \
+            profile.metadata() == exp_result \
+            and profile.rowcount == len(self.dataset)
+        self.assertTrue(test_result)
+
+    def test_merge_ok(self):
+        profile = DatasetProfile(self.header, self.dataset[:4])
+        other = DatasetProfile(self.header, self.dataset[4:])
+        profile.merge(other)
+        exp_result = inspect_dataset(self.dataset, self.header,
+                                     generate_report=False)
+        self.assertEqual(profile.metadata(), exp_result)
+
+    def test_merge_header_mismatch(self):
+        profile = DatasetProfile(self.header, self.dataset)
+        other = DatasetProfile(['a', 'b'], [['a1', 'b1']])
+        self.assertIsNone(profile.merge(other))
+
+    def test_report_output(self):
+        profile = DatasetProfile(self.header, self.dataset)
+        f, g = StringIO(), StringIO()
+        with redirect_stdout(f):
+            profile.report()
+        with redirect_stdout(g):
+            inspect_dataset(self.dataset, self.header)
+        self.assertEqual(f.getvalue(), g.getvalue())
+
+
 class Tests_gen_unique_values_count_Function(unittest.TestCase):
     """
     Unit tests for the function, `gen_unique_values_count`.
@@ -307,6 +677,42 @@ class Tests_gen_unique_values_count_Function(unittest.TestCase):
         test_result = gen_unique_values_count(dataset, header, 'c')
         self.assertEqual(test_result, values)
 
+    def test_gen_tables_multiple_columns_ok(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a1', 'bb', '7'],
+            ['jul', 'bx', '4.3'],
+            ['a3', 'b3', '4.2.4'],
+            ['a', 'b4', '1-10-2021']
+        ]
+        values = {
+            'c': {'N': 2, 'PD': 1, 'T': 1},
+            'a': {'PD': 1, 'PN': 2, 'T': 1}
+        }
+        test_result = gen_unique_values_count(dataset, header,
+                                              colnames=['c', 'a'])
+        self.assertEqual(test_result, values)
+
+    def test_non_existent_column_multiple_columns(self):
+        header = ['a', 'b', 'c']
+        dataset = [['a1', 'bb', '7']]
+        test_result = gen_unique_values_count(dataset, header,
+                                              colnames=['a', 'Z'])
+        self.assertIsNone(test_result)
+
+    def test_gen_table_approx_ok(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a1', 'bb', '7'],
+            ['jul', 'bx', '4.3'],
+            ['a3', 'b3', '4.2.4'],
+            ['a', 'b4', '1-10-2021']
+        ]
+        values = {'N': 2, 'PD': 1, 'T': 1}
+        test_result = gen_unique_values_count(dataset, header, 'c',
+                                              approx=True, precision=10)
+        self.assertEqual(test_result, values)
+
 
 class Tests_extract_unique_values_Function(unittest.TestCase):
     """
@@ -418,6 +824,42 @@ class Tests_extract_unique_values_Function(unittest.TestCase):
                                             coltype='PD')
         self.assertEqual(test_result, values)
 
+    def test_extract_multiple_columns_ok(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a1', 'bb', '7'],
+            ['jul', 'bx', '4.3'],
+            ['a3', 'b3', '4.2.4'],
+            ['a', 'b4', '1-10-2021'],
+            ['a', 'bb', '7']
+        ]
+        values = {'b': ['bb', 'bx'], 'c': ['4.3', '7'], 'a': ['a']}
+        test_result = extract_unique_values(dataset, header,
+                                            coltype={'c': 'N'},
+                                            sort=True,
+                                            colnames=['b', 'c', 'a'])
+        self.assertEqual(test_result, values)
+
+    def test_extract_multiple_columns_single_type_ok(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a1', 'bb', '7'],
+            ['jul', 'bx', '4.3'],
+            ['a', 'b4', '1-10-2021']
+        ]
+        values = {'a': ['a1'], 'b': ['b4']}
+        test_result = extract_unique_values(dataset, header,
+                                            coltype='PN',
+                                            colnames=['a', 'b'])
+        self.assertEqual(test_result, values)
+
+    def test_extract_multiple_columns_non_existent_column(self):
+        header = ['a', 'b', 'c']
+        dataset = [['a1', 'bb', '7']]
+        test_result = extract_unique_values(dataset, header,
+                                            colnames=['a', 'Z'])
+        self.assertIsNone(test_result)
+
 
 class Tests__extract_unique_values_Function(unittest.TestCase):
     """
@@ -530,6 +972,18 @@ class Tests__extract_unique_values_Function(unittest.TestCase):
         test_result = sorted(_extract_unique_values(values))
         self.assertEqual(test_result, sorted(uniques))
 
+    def test_extract_unique_values_ok_08(self):
+        values = [{'a': 1}, {'b': 2}, {'a': 1}]
+        uniques = [{'a': 1}, {'b': 2}]
+        test_result = _extract_unique_values(values)
+        self.assertEqual(test_result, uniques)
+
+    def test_extract_unique_values_ok_09(self):
+        values = [['z', 'y'], ['a', 'b'], ['z', 'y']]
+        uniques = ['z|y', 'a|b']
+        test_result = _extract_unique_values(values)
+        self.assertEqual(test_result, uniques)
+
 
 class Tests_gen_freq_table_Function(unittest.TestCase):
     """
@@ -596,6 +1050,369 @@ class Tests_gen_freq_table_Function(unittest.TestCase):
             and fqt.keys() == ret_fqt.keys()
         self.assertTrue(test_result)
 
+    def test_freq_count_top_ok(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a1', 'b1', 'c1'],
+            ['a2', 'b2', 'c2'],
+            ['a3', 'b3', 'c3'],
+            ['a3', 'b3', 'c3'],
+            ['a2', 'b2', 'c2'],
+            ['a3', 'b3', 'c3']
+        ]
+        fqt = {'b3': [3, 50.0], 'b2': [2, 100 / 3]}
+        ret_fqt = gen_freq_table(dataset, header, 'b', sort_by_value=True,
+                                 reverse=True, top=2)
+        test_result = \
+            list(ret_fqt) == list(fqt) \
+            and all(ret_fqt[k][0] == fqt[k][0] for k in fqt)
+        self.assertTrue(test_result)
+
+    def test_freq_count_top_approx_ok(self):
+        header = ['a']
+        dataset = \
+            [['x']] * 50 + [['y']] * 30 \
+            + [['z' + str(idx)] for idx in range(40)] + [['y']] * 10
+        ret_fqt = gen_freq_table(iter(dataset), header, 'a',
+                                 sort_by_value=True, reverse=True, top=2,
+                                 approx=True, capacity=8)
+        test_result = \
+            list(ret_fqt) == ['x', 'y'] \
+            and all(count - error <= {'x': 50, 'y': 40}[k] <= count
+                    for k, (count, _, error) in ret_fqt.items())
+        self.assertTrue(test_result)
+
+    def test_freq_count_top_invalid(self):
+        header = ['a', 'b', 'c']
+        dataset = [['a1', 'b1', 'c1']]
+        self.assertIsNone(gen_freq_table(dataset, header, 'b', top=0))
+
+    def test_freq_count_workers(self):
+        header = ['a', 'b']
+        dataset = [[f'x{i % 7}', f'y{i % 3}'] for i in range(100)]
+        for sort_by_value in (False, True):
+            for reverse in (False, True):
+                exp_result = gen_freq_table(dataset, header, 'a',
+                                            sort_by_value, reverse)
+                ret_fqt = gen_freq_table(dataset, header, 'a',
+                                         sort_by_value, reverse, workers=2)
+                self.assertEqual(list(ret_fqt.items()),
+                                 list(exp_result.items()))
+
+    def test_freq_count_multi_column(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a1', 'b1', 'c1'],
+            ['a2', 'b1', 'c2'],
+            ['a1', 'b1', 'c3'],
+            ['a1', 'b2', 'c4'],
+        ]
+        exp_result = {
+            ('a1', 'b1'): [2, 50.0],
+            ('a1', 'b2'): [1, 25.0],
+            ('a2', 'b1'): [1, 25.0],
+        }
+        ret_fqt = gen_freq_table(dataset, header, ['a', 'b'])
+        test_result = \
+            ret_fqt == exp_result \
+            and list(ret_fqt) == list(exp_result) \
+            and gen_freq_table(dataset, header, ['a'], top=1) \
+            == {('a1',): [3, 75.0]}
+        self.assertTrue(test_result)
+
+    def test_freq_count_multi_column_invalid(self):
+        header = ['a', 'b', 'c']
+        dataset = [['a1', 'b1', 'c1']]
+        test_result = \
+            gen_freq_table(dataset, header, ['a', 'x']) is None \
+            and gen_freq_table(dataset, header, []) is None
+        self.assertTrue(test_result)
+
+
+class Tests_crosstab_Function(unittest.TestCase):
+    """
+    Unit tests for the function, `crosstab`.
+    """
+
+    def test_crosstab_ok(self):
+        header = ['a', 'b', 'c']
+        dataset = [
+            ['a2', 'b1', 'c1'],
+            ['a1', 'b2', 'c2'],
+            ['a1', 'b1', 'c3'],
+            ['a1', 'b2', 'c4'],
+        ]
+        exp_result = {
+            'a1': {'b1': 1, 'b2': 2},
+            'a2': {'b1': 1, 'b2': 0},
+        }
+        ret_ct = crosstab(iter(dataset), header, 'a', 'b')
+        test_result = \
+            ret_ct == exp_result \
+            and list(ret_ct) == ['a1', 'a2'] \
+            and list(ret_ct['a2']) == ['b1', 'b2']
+        self.assertTrue(test_result)
+
+    def test_crosstab_invalid(self):
+        header = ['a', 'b', 'c']
+        dataset = [['a1', 'b1', 'c1']]
+        self.assertIsNone(crosstab(dataset, header, 'a', 'x'))
+
+
+class Tests_gen_histogram_Function(unittest.TestCase):
+    """
+    Unit tests for the function, `gen_histogram`.
+    """
+
+    header = ['a', 'b']
+    dataset = [
+        ['0', 'b1'],
+        ['1.5', 'b2'],
+        ['2', 'b3'],
+        ['abc', 'b4'],
+        ['$3,000', 'b5'],
+        ['4', 'b6'],
+        ['1+2j', 'b7'],
+        ['nan', 'b8'],
+        ['8', 'b9'],
+    ]
+
+    def test_histogram_fixed_width(self):
+        counts, edges = gen_histogram(self.dataset, self.header, 'a', 4)
+        test_result = \
+            list(counts) == [2, 1, 1, 1] \
+            and list(edges) == [0.0, 2.0, 4.0, 6.0, 8.0] \
+            and counts.typecode == 'q' \
+            and edges.typecode == 'd'
+        self.assertTrue(test_result)
+
+    def test_histogram_quantile(self):
+        counts, edges = gen_histogram(self.dataset, self.header, 'a', 2,
+                                      quantile=True)
+        test_result = \
+            list(counts) == [2, 3] \
+            and list(edges) == [0.0, 2.0, 8.0]
+        self.assertTrue(test_result)
+
+    def test_histogram_explicit_edges(self):
+        counts, edges = gen_histogram(self.dataset, self.header, 'a',
+                                      [1, 5, 3000], possible_numeric=True)
+        test_result = \
+            list(counts) == [3, 2] \
+            and list(edges) == [1.0, 5.0, 3000.0]
+        self.assertTrue(test_result)
+
+    def test_histogram_integer_edges(self):
+        counts, edges = gen_histogram([[str(i)] for i in range(101)], ['x'],
+                                      'x', bins=100)
+        test_result = \
+            list(counts) == [1] * 99 + [2] \
+            and list(edges) == [float(i) for i in range(101)]
+        self.assertTrue(test_result)
+
+    def test_histogram_extreme_values(self):
+        counts, edges = gen_histogram([['1e308'], ['-1e308'], ['0']], ['a'],
+                                      'a', 2)
+        test_result = \
+            list(counts) == [1, 2] \
+            and list(edges) == [-1e308, 0.0, 1e308]
+        self.assertTrue(test_result)
+
+    def test_histogram_invalid(self):
+        test_result = \
+            gen_histogram(self.dataset, self.header, 'c') is None \
+            and gen_histogram(self.dataset, self.header, 'a', 0) is None \
+            and gen_histogram(self.dataset, self.header, 'a',
+                              [2, 1]) is None
+        self.assertTrue(test_result)
+
+
+class Tests_group_by_Function(unittest.TestCase):
+    """
+    Unit tests for the function, `group_by`.
+    """
+
+    header = ['a', 'b', 'c']
+    dataset = [
+        ['a1', '1', 'c1'],
+        ['a2', '4', 'c2'],
+        ['a1', 'x', 'c1'],
+        ['a1', '3', 'c3'],
+        ['a1', '8', 'c1'],
+    ]
+    aggs = {
+        'n': ('count', None),
+        'sum': ('sum', 'b'),
+        'min': ('min', 'b'),
+        'max': ('max', 'b'),
+        'mean': ('mean', 'b'),
+        'var': ('var', 'b'),
+        'first': ('first', 'c'),
+        'last': ('last', 'c'),
+        'distinct': ('distinct', 'c'),
+    }
+
+    def test_group_by_ok(self):
+        exp_result = {
+            'a1': {'n': 4, 'sum': 12.0, 'min': 1.0, 'max': 8.0,
+                   'mean': 4.0, 'var': 13.0, 'first': 'c1', 'last': 'c1',
+                   'distinct': 2},
+            'a2': {'n': 1, 'sum': 4.0, 'min': 4.0, 'max': 4.0,
+                   'mean': 4.0, 'var': None, 'first': 'c2', 'last': 'c2',
+                   'distinct': 1},
+        }
+        ret_gb = group_by(iter(self.dataset), self.header, 'a', self.aggs)
+        self.assertEqual(ret_gb, exp_result)
+
+    def test_group_by_multi_key(self):
+        exp_result = {
+            ('a1', 'c1'): {'n': 3},
+            ('a1', 'c3'): {'n': 1},
+            ('a2', 'c2'): {'n': 1},
+        }
+        ret_gb = group_by(self.dataset, self.header, ['a', 'c'],
+                          {'n': ('count', 'b')})
+        test_result = \
+            ret_gb == exp_result \
+            and list(ret_gb) == list(exp_result)
+        self.assertTrue(test_result)
+
+    def test_group_by_invalid(self):
+        test_result = \
+            group_by(self.dataset, self.header, 'x', self.aggs) is None \
+            and group_by(self.dataset, self.header, 'a',
+                         {'n': ('median', 'b')}) is None \
+            and group_by(self.dataset, self.header, 'a',
+                         {'n': ('sum', None)}) is None
+        self.assertTrue(test_result)
+
+
+class Tests_GroupBy_Class(unittest.TestCase):
+    """
+    Unit tests for the class, `GroupBy`.
+    """
+
+    header = Tests_group_by_Function.header
+    dataset = Tests_group_by_Function.dataset
+    aggs = Tests_group_by_Function.aggs
+
+    def test_update_ok(self):
+        groups = GroupBy(self.header, 'a', self.aggs, self.dataset[:2])
+        groups.update(self.dataset[2:])
+        exp_result = group_by(self.dataset, self.header, 'a', self.aggs)
+        self.assertEqual(groups.result(), exp_result)
+
+    def test_merge_ok(self):
+        groups = GroupBy(self.header, 'a', self.aggs, self.dataset[:3])
+        other = GroupBy(self.header, 'a', self.aggs, self.dataset[3:])
+        groups.merge(other)
+        exp_result = group_by(self.dataset, self.header, 'a', self.aggs)
+        self.assertEqual(groups.result(), exp_result)
+
+    def test_distinct_sketch(self):
+        # 1 group past the exact limit (64 at precision 12), 1 under
+        dataset = [['a1', f'b{i}'] for i in range(1000)] \
+            + [['a2', f'b{i % 10}'] for i in range(1000)]
+        aggs = {'distinct': ('distinct', 'b')}
+        groups = GroupBy(['a', 'b'], 'a', aggs, dataset[:1030])
+        groups.merge(GroupBy(['a', 'b'], 'a', aggs, dataset[1030:]))
+        ret_result = groups.result()
+        exp_result = group_by(dataset, ['a', 'b'], 'a', aggs)
+        test_result = \
+            ret_result == exp_result \
+            and abs(ret_result['a1']['distinct'] - 1000) <= 50 \
+            and ret_result['a2']['distinct'] == 10
+        self.assertTrue(test_result)
+
+    def test_pickle_ok(self):
+        groups = GroupBy(self.header, ['a', 'c'], self.aggs, self.dataset)
+        copy = pickle.loads(pickle.dumps(groups))
+        copy.merge(GroupBy(self.header, ['a', 'c'], self.aggs,
+                           self.dataset))
+        exp_result = \
+            group_by(self.dataset * 2, self.header, ['a', 'c'], self.aggs)
+        test_result = \
+            copy.result() == exp_result \
+            and groups.result() == group_by(self.dataset, self.header,
+                                            ['a', 'c'], self.aggs)
+        self.assertTrue(test_result)
+
+    def test_merge_mismatch(self):
+        groups = GroupBy(self.header, 'a', self.aggs)
+        other = GroupBy(self.header, 'c', self.aggs)
+        self.assertIsNone(groups.merge(other))
+
+    def test_aggs_invalid(self):
+        with self.assertRaises(ValueError):
+            GroupBy(self.header, 'a', {'n': ('sum', 'x')})
+
+
+class Tests_FrequencySketch_Class(unittest.TestCase):
+    """
+    Unit tests for the class, `FrequencySketch`.
+    """
+
+    header = ['a', 'b']
+    dataset = \
+        [[f'x{i % 50}', 'b'] for i in range(1000)] \
+        + [['y', 'b']] * 300
+
+    def test_estimate_ok(self):
+        sketch = FrequencySketch(self.dataset, self.header, 'a')
+        test_result = \
+            sketch.total == len(self.dataset) \
+            and sketch.estimate('y') == 300 \
+            and sketch.estimate('x7') == 20 \
+            and sketch.estimate('z') == 0
+        self.assertTrue(test_result)
+
+    def test_estimate_never_under(self):
+        sketch = FrequencySketch(self.dataset, self.header, 'a', width=8,
+                                 depth=2)
+        test_result = \
+            sketch.estimate('y') >= 300 \
+            and all(sketch.estimate(f'x{i}') >= 20 for i in range(50))
+        self.assertTrue(test_result)
+
+    def test_merge_ok(self):
+        sketch = FrequencySketch(self.dataset[:700], self.header, 'a')
+        other = FrequencySketch(self.dataset[700:], self.header, 'a')
+        exp_sketch = FrequencySketch(self.dataset, self.header, 'a')
+        sketch.merge(other)
+        self.assertEqual(sketch.to_bytes(), exp_sketch.to_bytes())
+
+    def test_merge_mismatch(self):
+        sketch = FrequencySketch(self.dataset, self.header, 'a')
+        other = FrequencySketch(self.dataset, self.header, 'a', width=64)
+        self.assertIsNone(sketch.merge(other))
+
+    def test_serialise_ok(self):
+        sketch = FrequencySketch(iter(self.dataset), self.header, 'a')
+        copy = FrequencySketch.from_bytes(sketch.to_bytes())
+        test_result = \
+            copy.total == sketch.total \
+            and copy.estimate('y') == sketch.estimate('y') \
+            and copy.to_bytes() == sketch.to_bytes()
+        self.assertTrue(test_result)
+
+    def test_deserialise_invalid(self):
+        data = FrequencySketch(self.dataset, self.header, 'a').to_bytes()
+        test_result = \
+            FrequencySketch.from_bytes(b'not a sketch') is None \
+            and FrequencySketch.from_bytes(b'DQFS\x02\x00\x00\x00{}') is None \
+            and FrequencySketch.from_bytes(b'DQFS\x02\x00\x00\x00[]') is None \
+            and FrequencySketch.from_bytes(b'DQFS\xff\x00\x00\x00{') is None \
+            and FrequencySketch.from_bytes(data[:-1]) is None \
+            and FrequencySketch.from_bytes(
+                data.replace(b'"total"', b'"count"')) is None \
+            and FrequencySketch.from_bytes(
+                data.replace(b'"total": 1300', b'"total": "13"')) is None
+        self.assertTrue(test_result)
+
+    def test_colname_invalid(self):
+        with self.assertRaises(ValueError):
+            FrequencySketch(self.dataset, self.header, 'c')
+
 
 class Tests_add_column_Function(unittest.TestCase):
     """
@@ -1257,6 +2074,336 @@ class Tests_load_csv_dataset_Function(unittest.TestCase):
             and cmphd
         self.assertTrue(test_result)
 
+    def test_load_csv_parallel(self):
+        csvdata = \
+            'a,b,c\r\n' + ''.join(f'a{i},b{i},\r\n' for i in range(50))
+        file = NamedTemporaryFile(mode='w+', delete=False, newline='')
+        filename = file.name
+        _ = file.write(csvdata)
+        file.close()
+        exp_ds, exp_hd = load_csv_dataset(filename)
+        ret_ds, ret_hd = load_csv_dataset(filename, parallel=2)
+        unlink(filename)
+        test_result = \
+            ret_ds == exp_ds \
+            and ret_hd == exp_hd \
+            and len(ret_ds) == 50
+        self.assertTrue(test_result)
+
+    def test_load_csv_parallel_quoted(self):
+        csvdata = 'a,b\n"a\n1",b1\na2,b2\n'
+        file = NamedTemporaryFile(mode='w+', delete=False)
+        filename = file.name
+        _ = file.write(csvdata)
+        file.close()
+        ret_ds, ret_hd = load_csv_dataset(filename, parallel=2)
+        unlink(filename)
+        test_result = \
+            ret_ds == [['a\n1', 'b1'], ['a2', 'b2']] \
+            and ret_hd == ['a', 'b']
+        self.assertTrue(test_result)
+
+    def test_load_csv_fast(self):
+        csvdata = 'a,b,c\r\na1,,c1\n\n,\na4,b4,c4'
+        file = NamedTemporaryFile(mode='w+', delete=False, newline='')
+        filename = file.name
+        _ = file.write(csvdata)
+        file.close()
+        exp_ds, exp_hd = load_csv_dataset(filename, fast=False)
+        ret_ds, ret_hd = load_csv_dataset(filename, fast=True)
+        auto_ds, auto_hd = load_csv_dataset(filename)
+        unlink(filename)
+        test_result = \
+            ret_ds == exp_ds == auto_ds \
+            and ret_hd == exp_hd == auto_hd \
+            and ret_ds[1] == []
+        self.assertTrue(test_result)
+
+    def test_load_csv_fast_quoted(self):
+        csvdata = 'a,b\n"a,1",b1\n'
+        file = NamedTemporaryFile(mode='w+', delete=False)
+        filename = file.name
+        _ = file.write(csvdata)
+        file.close()
+        auto_ds, _ = load_csv_dataset(filename)
+        ret_ds, _ = load_csv_dataset(filename, fast=True)
+        unlink(filename)
+        test_result = \
+            auto_ds == [['a,1', 'b1']] \
+            and ret_ds == [['"a', '1"', 'b1']]
+        self.assertTrue(test_result)
+
+    def test_load_csv_compressed(self):
+        csvdata = b'a,b,c\na1,b1,c1\n"a\n2",b2,c2\n'
+        exp_ds = [['a1', 'b1', 'c1'], ['a\n2', 'b2', 'c2']]
+        for compress, compression in ((gzip_compress, 'gzip'),
+                                      (bz2_compress, 'bz2'),
+                                      (xz_compress, 'xz')):
+            file = NamedTemporaryFile(mode='wb', delete=False)
+            filename = file.name
+            _ = file.write(compress(csvdata))
+            file.close()
+            stats = {}
+            ret_ds, ret_hd = load_csv_dataset(filename, parallel=2,
+                                              stats=stats)
+            rows = list(iter_csv_dataset(filename))
+            unlink(filename)
+            test_result = \
+                ret_ds == exp_ds \
+                and ret_hd == ['a', 'b', 'c'] \
+                and rows == [ret_hd] + exp_ds \
+                and stats['compression'] == compression \
+                and stats['data_bytes'] == len(csvdata) \
+                and stats['rows'] == 2
+            self.assertTrue(test_result)
+
+    def test_load_csv_empty_file(self):
+        file = NamedTemporaryFile(mode='w+', delete=False)
+        filename = file.name
+        file.close()
+        ret_ds, ret_hd = load_csv_dataset(filename)
+        unlink(filename)
+        self.assertTrue(ret_ds is None and ret_hd is None)
+
+
+class Tests_csv_cache_Functions(unittest.TestCase):
+    """
+    Unit tests for the `load_csv_dataset` cache, and `clear_csv_cache`.
+    """
+
+    def setUp(self):
+        self.cache_dir = TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        file = NamedTemporaryFile(mode='w+', delete=False)
+        self.filename = file.name
+        _ = file.write('a,b\n"a,1",b1\na2,b2\n')
+        file.close()
+        self.addCleanup(unlink, self.filename)
+
+    def test_cache_hit(self):
+        exp_ds, exp_hd = load_csv_dataset(self.filename)
+        cold_stats, warm_stats = {}, {}
+        cold_ds, cold_hd = load_csv_dataset(
+            self.filename, cache_dir=self.cache_dir.name, stats=cold_stats)
+        warm_ds, warm_hd = load_csv_dataset(
+            self.filename, cache_dir=self.cache_dir.name, stats=warm_stats)
+        test_result = \
+            cold_ds == warm_ds == exp_ds \
+            and cold_hd == warm_hd == exp_hd \
+            and not cold_stats['cached'] \
+            and warm_stats['cached'] \
+            and len(listdir(self.cache_dir.name)) == 1
+        self.assertTrue(test_result)
+
+    def test_cache_file_changed(self):
+        load_csv_dataset(self.filename, cache_dir=self.cache_dir.name)
+        with open(self.filename, 'a') as file:
+            _ = file.write('a3,b3\n')
+        stats = {}
+        ret_ds, _ = load_csv_dataset(self.filename, stats=stats,
+                                     cache_dir=self.cache_dir.name)
+        test_result = \
+            ret_ds[-1] == ['a3', 'b3'] \
+            and not stats['cached'] \
+            and len(listdir(self.cache_dir.name)) == 1
+        self.assertTrue(test_result)
+
+    def test_cache_eviction(self):
+        load_csv_dataset(self.filename, cache_dir=self.cache_dir.name,
+                         cache_max_bytes=0)
+        self.assertEqual(listdir(self.cache_dir.name), [])
+
+    def test_clear_csv_cache(self):
+        load_csv_dataset(self.filename, cache_dir=self.cache_dir.name)
+        test_result = \
+            clear_csv_cache(self.cache_dir.name, '***OTHER_FILE***') == 0 \
+            and clear_csv_cache(self.cache_dir.name, self.filename) == 1 \
+            and listdir(self.cache_dir.name) == []
+        self.assertTrue(test_result)
+
+
+class Tests_iter_csv_dataset_Function(unittest.TestCase):
+    """
+    Unit tests for the function, `iter_csv_dataset`.
+    """
+
+    csvdata = 'a,b,c\na1,b1,c1\na2,b2,c2\na3,b3,c3\n'
+
+    def setUp(self):
+        file = NamedTemporaryFile(mode='w+', delete=False)
+        self.filename = file.name
+        _ = file.write(self.csvdata)
+        file.close()
+
+    def tearDown(self):
+        unlink(self.filename)
+
+    def test_non_existent_file(self):
+        self.assertIsNone(iter_csv_dataset('***NON_EXISTENT_FILE***'))
+
+    def test_chunksize_invalid(self):
+        self.assertIsNone(iter_csv_dataset(self.filename, chunksize=0))
+
+    def test_iter_rows_ok(self):
+        exp_ds, exp_hd = load_csv_dataset(self.filename)
+        rows = iter_csv_dataset(self.filename)
+        test_result = \
+            next(rows) == exp_hd \
+            and list(rows) == exp_ds
+        self.assertTrue(test_result)
+
+    def test_iter_chunks_ok(self):
+        exp_ds, exp_hd = load_csv_dataset(self.filename)
+        rows = iter_csv_dataset(self.filename, chunksize=2)
+        test_result = \
+            next(rows) == exp_hd \
+            and list(rows) == [exp_ds[:2], exp_ds[2:]]
+        self.assertTrue(test_result)
+
+
+class Tests_MappedCSVDataset_Class(unittest.TestCase):
+    """
+    Unit tests for the class, `MappedCSVDataset`.
+    """
+
+    def load(self, csvdata):
+        file = NamedTemporaryFile(mode='w+', delete=False, newline='')
+        filename = file.name
+        _ = file.write(csvdata)
+        file.close()
+        exp_ds, exp_hd = load_csv_dataset(filename)
+        dataset = MappedCSVDataset(filename)
+        self.addCleanup(unlink, filename)
+        self.addCleanup(dataset.close)
+        return dataset, exp_ds, exp_hd
+
+    def test_rows_ok(self):
+        dataset, exp_ds, exp_hd = \
+            self.load('a,b,c\na1,b1,c1\n\na3,b3,c3\r\na4,b4')
+        test_result = \
+            dataset.header == exp_hd \
+            and len(dataset) == len(exp_ds) \
+            and list(dataset) == exp_ds \
+            and dataset[1] == [] \
+            and dataset[-1] == ['a4', 'b4']
+        self.assertTrue(test_result)
+
+    def test_quoted_rows_ok(self):
+        dataset, exp_ds, exp_hd = \
+            self.load('a,b\n"a\n1","b,""1"""\na2,b2\n')
+        test_result = \
+            dataset.header == exp_hd \
+            and dataset[:] == exp_ds \
+            and dataset[0] == ['a\n1', 'b,"1"']
+        self.assertTrue(test_result)
+
+    def test_random_sample_ok(self):
+        dataset, exp_ds, _ = \
+            self.load('a\n' + ''.join(f'{i}\n' for i in range(10)))
+        sample = Random(1).sample(dataset, 4)
+        test_result = \
+            len(sample) == 4 \
+            and all(row in exp_ds for row in sample) \
+            and sample == Random(1).sample(exp_ds, 4)
+        self.assertTrue(test_result)
+
+    def test_slice_ok(self):
+        dataset, exp_ds, _ = \
+            self.load('a\n' + ''.join(f'{i}\n' for i in range(10)))
+        test_result = \
+            dataset[2:5] == exp_ds[2:5] \
+            and dataset[::3] == exp_ds[::3] \
+            and extract_row_range(dataset, (3, 6)) == exp_ds[3:7]
+        self.assertTrue(test_result)
+
+    def test_compressed_file(self):
+        file = NamedTemporaryFile(mode='wb', delete=False)
+        filename = file.name
+        _ = file.write(gzip_compress(b'a\na1\n'))
+        file.close()
+        self.addCleanup(unlink, filename)
+        with self.assertRaises(ValueError):
+            MappedCSVDataset(filename)
+
+    def test_index_out_of_range(self):
+        dataset, _, _ = self.load('a\na1\n')
+        with self.assertRaises(IndexError):
+            dataset[1]
+
+
+class Tests_load_csv_columns_Function(unittest.TestCase):
+    """
+    Unit tests for the function, `load_csv_columns`.
+    """
+
+    csvdata = 'a,b,c,d\n1,0.5,x,1\n-20,2.25,y,2.5\n3,1e-07,x,\n'
+
+    def setUp(self):
+        file = NamedTemporaryFile(mode='w+', delete=False)
+        self.filename = file.name
+        _ = file.write(self.csvdata)
+        file.close()
+
+    def tearDown(self):
+        unlink(self.filename)
+
+    def test_non_existent_file(self):
+        ret_ds, ret_hd = load_csv_columns('***NON_EXISTENT_FILE***')
+        self.assertTrue(ret_ds is None and ret_hd is None)
+
+    def test_load_columns_ok(self):
+        ret_ds, ret_hd = load_csv_columns(self.filename)
+        a, b, c, d = ret_ds.columns
+        test_result = \
+            ret_hd == ['a', 'b', 'c', 'd'] \
+            and a == array('q', [1, -20, 3]) \
+            and b == array('d', [0.5, 2.25, 1e-07]) \
+            and c == ['x', 'y', 'x'] \
+            and c[0] is c[2] \
+            and d == ['1', '2.5', ''] \
+            and len(ret_ds) == 3 \
+            and ret_ds[1] == [-20, 2.25, 'y', '2.5'] \
+            and list(ret_ds)[2] == [3, 1e-07, 'x', '']
+        self.assertTrue(test_result)
+
+    def test_load_columns_dtypes(self):
+        ret_ds, _ = load_csv_columns(self.filename, {'a': float, 'b': str})
+        a, b, _, _ = ret_ds.columns
+        test_result = \
+            a == array('d', [1.0, -20.0, 3.0]) \
+            and b == ['0.5', '2.25', '1e-07']
+        self.assertTrue(test_result)
+
+    def test_load_columns_dtypes_invalid(self):
+        test_result = all(
+            load_csv_columns(self.filename, dtypes) == (None, None)
+            for dtypes in ({'x': int}, {'a': list}, {'d': float}))
+        self.assertTrue(test_result)
+
+    def test_columnar_dataset_sequence(self):
+        ret_ds, _ = load_csv_columns(self.filename)
+        exp_ds = [list(row) for row in ret_ds]
+        test_result = \
+            Random(1).sample(ret_ds, 2) == Random(1).sample(exp_ds, 2) \
+            and list(reversed(ret_ds)) == exp_ds[::-1] \
+            and [3, 1e-07, 'x', ''] in ret_ds \
+            and ret_ds.index([-20, 2.25, 'y', '2.5']) == 1
+        self.assertTrue(test_result)
+
+    def test_columnar_dataset_functions(self):
+        ret_ds, ret_hd = load_csv_columns(self.filename)
+        exp_ds = [list(row) for row in ret_ds]
+        test_result = \
+            inspect_dataset(ret_ds, ret_hd, generate_report=False) \
+            == inspect_dataset(exp_ds, ret_hd, generate_report=False) \
+            and gen_freq_table(ret_ds, ret_hd, 'c') \
+            == gen_freq_table(exp_ds, ret_hd, 'c') \
+            and gen_freq_table(ret_ds, ret_hd, ['a', 'c']) \
+            == gen_freq_table(exp_ds, ret_hd, ['a', 'c']) \
+            and extract_unique_values(ret_ds, ret_hd, 'a', coltype='N') \
+            == extract_unique_values(exp_ds, ret_hd, 'a', coltype='N')
+        self.assertTrue(test_result)
+
 
 if __name__ == "__main__":
     pass